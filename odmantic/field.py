@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import sys
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -194,7 +195,9 @@ class ODMBaseField(metaclass=abc.ABCMeta):
     __allowed_operators__: Set[str]
 
     def __init__(self, key_name: str, model_config: ODMConfigDict):
-        self.key_name = key_name
+        # Interned since the key name is used to index every (de)serialized document,
+        # str subclasses (enums, KeyNameProxy) can't be interned
+        self.key_name = sys.intern(key_name) if type(key_name) is str else key_name
         self.model_config = model_config
 
     def bind_pydantic_field(self, field: FieldInfo) -> None:
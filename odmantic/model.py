@@ -26,6 +26,7 @@ from typing import (
     cast,
     no_type_check,
 )
+from weakref import WeakKeyDictionary
 
 import bson
 import pydantic
@@ -110,15 +111,6 @@ def should_touch_field(value: Any = None, type_: Optional[Type] = None) -> bool:
     )
 
 
-def find_duplicate_key(fields: Iterable[ODMBaseField]) -> Optional[str]:
-    seen: Set[str] = set()
-    for f in fields:
-        if f.key_name in seen:
-            return f.key_name
-        seen.add(f.key_name)
-    return None
-
-
 _IMMUTABLE_TYPES = (
     type(None),
     bool,
@@ -204,6 +196,21 @@ def validate_type(type_: Type) -> Type:
     return type_
 
 
+_EXTRA_BSON_SERIALIZERS: WeakKeyDictionary[
+    Type, Optional[Callable[[Any], Any]]
+] = WeakKeyDictionary()
+
+
+def get_extra_bson_serializer(type_: Type) -> Optional[Callable[[Any], Any]]:
+    # Memoized since extra values types are resolved on every document generation
+    try:
+        return _EXTRA_BSON_SERIALIZERS[type_]
+    except KeyError:
+        bson_serializer = _get_bson_serializer(validate_type(type_))
+        _EXTRA_BSON_SERIALIZERS[type_] = bson_serializer
+        return bson_serializer
+
+
 class BaseModelMetaclass(pydantic._internal._model_construction.ModelMetaclass):
     @staticmethod
     def __validate_cls_namespace__(  # noqa C901
@@ -215,38 +222,41 @@ class BaseModelMetaclass(pydantic._internal._model_construction.ModelMetaclass):
         )
         config = validate_config(namespace.get("model_config", ODMConfigDict()), name)
         odm_fields: Dict[str, ODMBaseField] = {}
-        references: List[str] = []
         bson_serializers: Dict[str, Callable[[Any], Any]] = {}
         mutable_fields: Set[str] = set()
+        key_names: Set[str] = set()
 
         # Make sure all fields are defined with type annotation
         for field_name, value in namespace.items():
+            # Check the annotations first since most of the namespace entries are
+            # annotated fields, skipping the dunder and descriptor checks for them
             if (
-                should_touch_field(value=value)
+                field_name not in annotations
                 and not is_dunder(field_name)
-                and field_name not in annotations
+                and should_touch_field(value=value)
                 and not field_name.startswith("model_")
             ):
                 raise TypeError(
                     f"field {field_name} is defined without type annotation"
                 )
 
-        # Validate fields types and substitute bson fields
-        for field_name, field_type in annotations.items():
-            if not is_dunder(field_name) and should_touch_field(type_=field_type):
-                substituted_type = validate_type(field_type)
-                annotations[field_name] = substituted_type
-                # Handle BSON serialized fields after substitution to allow some
-                # builtin substitutions
-                bson_serializer = _get_bson_serializer(substituted_type)
-                if bson_serializer is not None:
-                    bson_serializers[field_name] = bson_serializer
-
         # Validate fields
         for field_name, field_type in annotations.items():
-            value = namespace.get(field_name, Undefined)
+            if is_dunder(field_name) or not should_touch_field(type_=field_type):
+                continue
+
+            # Validate the field type and substitute bson fields
+            substituted_type = validate_type(field_type)
+            if substituted_type is not field_type:
+                annotations[field_name] = field_type = substituted_type
+            # Handle BSON serialized fields after substitution to allow some
+            # builtin substitutions
+            bson_serializer = _get_bson_serializer(field_type)
+            if bson_serializer is not None:
+                bson_serializers[field_name] = bson_serializer
 
-            if is_dunder(field_name) or not should_touch_field(value, field_type):
+            value = namespace.get(field_name, Undefined)
+            if not should_touch_field(value=value):
                 continue  # pragma: no cover
                 # https://github.com/nedbat/coveragepy/issues/198
 
@@ -326,7 +336,6 @@ class BaseModelMetaclass(pydantic._internal._model_construction.ModelMetaclass):
                 odm_fields[field_name] = ODMReference(
                     model=field_type, key_name=key_name, model_config=config
                 )
-                references.append(field_name)
                 del namespace[field_name]  # Remove default ODMReferenceInfo value
             else:
                 if isinstance(value, ODMFieldInfo):
@@ -360,15 +369,20 @@ class BaseModelMetaclass(pydantic._internal._model_construction.ModelMetaclass):
                         primary_field=False, key_name=field_name, model_config=config
                     )
 
-        # NOTE: Duplicate key detection make sur that at most one primary key is
-        # defined
-        duplicate_key = find_duplicate_key(odm_fields.values())
-        if duplicate_key is not None:
-            raise TypeError(f"Duplicated key_name: {duplicate_key} in {name}")
+            # NOTE: Duplicate key detection make sur that at most one primary key is
+            # defined
+            key_name = odm_fields[field_name].key_name
+            if key_name in key_names:
+                raise TypeError(f"Duplicated key_name: {key_name} in {name}")
+            key_names.add(key_name)
 
         namespace["__annotations__"] = annotations
         namespace["__odm_fields__"] = odm_fields
-        namespace["__references__"] = tuple(references)
+        namespace["__references__"] = tuple(
+            field_name
+            for field_name, field in odm_fields.items()
+            if isinstance(field, ODMReference)
+        )
         namespace["__bson_serializers__"] = bson_serializers
         namespace["__mutable_fields__"] = frozenset(mutable_fields)
         namespace["model_config"] = config
@@ -402,13 +416,26 @@ class BaseModelMetaclass(pydantic._internal._model_construction.ModelMetaclass):
             # classes)
             if namespace.get("__doc__", None) is None:
                 namespace["__doc__"] = ""
+            # Snapshot the field items once to iterate them cheaply when
+            # (de)serializing documents
+            odm_fields: Dict[str, ODMBaseField] = namespace["__odm_fields__"]
+            namespace["__odm_field_items__"] = tuple(odm_fields.items())
+            # Key mapping of the models only made of plain fields, allowing to
+            # skip the per field type dispatch
+            namespace["__odm_plain_keymap__"] = (
+                tuple(
+                    (field_name, field.key_name)
+                    for field_name, field in odm_fields.items()
+                )
+                if all(type(field) is ODMField for field in odm_fields.values())
+                else None
+            )
 
         cls = super().__new__(mcs, name, bases, namespace, **kwargs)
 
         if is_custom_cls:
             config: ODMConfigDict = namespace["model_config"]
             # Patch Model related fields to build a "pure" pydantic model
-            odm_fields: Dict[str, ODMBaseField] = namespace["__odm_fields__"]
             for field_name, field in odm_fields.items():
                 if isinstance(field, (ODMReference, ODMEmbedded)):
                     namespace["__annotations__"][
@@ -528,6 +555,8 @@ class _BaseODMModel(pydantic.BaseModel, metaclass=ABCMeta):
 
     if TYPE_CHECKING:
         __odm_fields__: ClassVar[Dict[str, ODMBaseField]] = {}
+        __odm_field_items__: ClassVar[Tuple[Tuple[str, ODMBaseField], ...]] = ()
+        __odm_plain_keymap__: ClassVar[Optional[Tuple[Tuple[str, str], ...]]] = None
         __bson_serializers__: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
         __mutable_fields__: ClassVar[FrozenSet[str]] = frozenset()
         __references__: ClassVar[Tuple[str, ...]] = ()
@@ -612,7 +641,7 @@ class _BaseODMModel(pydantic.BaseModel, metaclass=ABCMeta):
         Set them as if they were modified to make sure they are saved in the database.
         """
         object.__setattr__(self, "__fields_modified__", set(self.model_fields))
-        for field_name, field in self.__odm_fields__.items():
+        for field_name, field in self.__odm_field_items__:
             if isinstance(field, ODMEmbedded):
                 value = getattr(self, field_name)
                 value._post_copy_update()
@@ -726,7 +755,15 @@ class _BaseODMModel(pydantic.BaseModel, metaclass=ABCMeta):
         Returns:
             the document associated to the instance
         """
-        raw_doc = self.model_dump()
+        if include is not None and self.model_config["extra"] == "allow":
+            # Extra and computed fields are always part of the generated document
+            include = {
+                *include,
+                *(self.__pydantic_extra__ or ()),
+                *self.model_computed_fields,
+            }
+        # Only dump the included fields instead of the whole instance
+        raw_doc = self.model_dump(include=cast("IncEx", include))
         doc = self.__doc(raw_doc, type(self), include)
         return doc
 
@@ -736,38 +773,55 @@ class _BaseODMModel(pydantic.BaseModel, metaclass=ABCMeta):
         model: Type["_BaseODMModel"],
         include: Optional["AbstractSetIntStr"] = None,
     ) -> Dict[str, Any]:
-        doc: Dict[str, Any] = {}
-        for field_name, field in model.__odm_fields__.items():
-            if include is not None and field_name not in include:
-                continue
-            if isinstance(field, ODMReference):
-                doc[field.key_name] = raw_doc[field_name][field.model.__primary_field__]
-            elif isinstance(field, ODMEmbedded):
-                doc[field.key_name] = self.__doc(raw_doc[field_name], field.model, None)
-            elif isinstance(field, ODMEmbeddedGeneric):
-                if field.generic_origin is dict:
-                    doc[field.key_name] = {
-                        item_key: self.__doc(item_value, field.model)
-                        for item_key, item_value in raw_doc[field_name].items()
-                    }
-                else:
-                    doc[field.key_name] = [
-                        self.__doc(item, field.model) for item in raw_doc[field_name]
+        doc: Dict[str, Any]
+        plain_keymap = model.__odm_plain_keymap__
+        bson_serializers = model.__bson_serializers__
+        if plain_keymap is not None and not bson_serializers:
+            # Models made only of plain fields are mapped key by key in a single pass
+            doc = {
+                key_name: raw_doc[field_name]
+                for field_name, key_name in plain_keymap
+                if include is None or field_name in include
+            }
+        else:
+            doc = {}
+            for field_name, field in model.__odm_field_items__:
+                if include is not None and field_name not in include:
+                    continue
+                # Plain fields are the most common, check their exact type first
+                # since embedded fields subclass ODMField
+                if type(field) is ODMField:
+                    bson_serializer = bson_serializers.get(field_name)
+                    if bson_serializer is not None:
+                        doc[field.key_name] = bson_serializer(raw_doc[field_name])
+                    else:
+                        doc[field.key_name] = raw_doc[field_name]
+                elif isinstance(field, ODMReference):
+                    doc[field.key_name] = raw_doc[field_name][
+                        field.model.__primary_field__
                     ]
-            elif field_name in model.__bson_serializers__:
-                doc[field.key_name] = model.__bson_serializers__[field_name](
-                    raw_doc[field_name]
-                )
-            else:
-                doc[field.key_name] = raw_doc[field_name]
+                elif isinstance(field, ODMEmbedded):
+                    doc[field.key_name] = self.__doc(
+                        raw_doc[field_name], field.model, None
+                    )
+                elif isinstance(field, ODMEmbeddedGeneric):
+                    if field.generic_origin is dict:
+                        doc[field.key_name] = {
+                            item_key: self.__doc(item_value, field.model)
+                            for item_key, item_value in raw_doc[field_name].items()
+                        }
+                    else:
+                        doc[field.key_name] = [
+                            self.__doc(item, field.model)
+                            for item in raw_doc[field_name]
+                        ]
 
         if model.model_config["extra"] == "allow":
             # raw_doc is indexed by field name so we compare against odm field names
             extras = set(raw_doc.keys()) - set(self.__odm_fields__.keys())
             for extra in extras:
                 value = raw_doc[extra]
-                subst_type = validate_type(type(value))
-                bson_serializer = _get_bson_serializer(subst_type)
+                bson_serializer = get_extra_bson_serializer(type(value))
                 if bson_serializer is not None:
                     doc[extra] = bson_serializer(value)
                 else:
@@ -816,8 +870,39 @@ class _BaseODMModel(pydantic.BaseModel, metaclass=ABCMeta):
     ) -> Tuple[List[InitErrorDetails], Dict[str, Any]]:
         errors: List[InitErrorDetails] = []
         obj: Dict[str, Any] = {}
-        for field_name, field in cls.__odm_fields__.items():
-            if isinstance(field, ODMReference):
+        field_items = cls.__odm_field_items__
+        plain_keymap = cls.__odm_plain_keymap__
+        if plain_keymap is not None:
+            # Models made only of plain fields are mapped key by key in a single pass
+            # when every key is in the document; otherwise the per field parsing
+            # below handles the defaults and the missing keys errors
+            try:
+                obj = {
+                    field_name: raw_doc[key_name]
+                    for field_name, key_name in plain_keymap
+                }
+                field_items = ()
+            except KeyError:
+                pass
+        for field_name, field in field_items:
+            # Plain fields are the most common, check their exact type first since
+            # embedded fields subclass ODMField
+            if type(field) is ODMField:
+                value = raw_doc.get(field.key_name, Undefined)
+                if value is Undefined and not field.is_required_in_doc():
+                    value = field.get_default_importing_value()
+
+                if value is Undefined:
+                    errors.append(
+                        InitErrorDetails(
+                            type=KeyNotFoundInDocumentError(field.key_name),
+                            loc=base_loc + (field_name,),
+                            input=raw_doc,
+                        )
+                    )
+                else:
+                    obj[field_name] = value
+            elif isinstance(field, ODMReference):
                 sub_doc = raw_doc.get(field.key_name)
                 if sub_doc is None:
                     errors.append(
@@ -907,22 +992,6 @@ class _BaseODMModel(pydantic.BaseModel, metaclass=ABCMeta):
                         )
                     else:
                         obj[field_name] = value
-            else:
-                field = cast(ODMField, field)
-                value = raw_doc.get(field.key_name, Undefined)
-                if value is Undefined and not field.is_required_in_doc():
-                    value = field.get_default_importing_value()
-
-                if value is Undefined:
-                    errors.append(
-                        InitErrorDetails(
-                            type=KeyNotFoundInDocumentError(field.key_name),
-                            loc=base_loc + (field_name,),
-                            input=raw_doc,
-                        )
-                    )
-                else:
-                    obj[field_name] = value
 
         if cls.model_config["extra"] == "allow":
             extras = set(raw_doc.keys()) - set(obj.keys())
@@ -1,4 +1,8 @@
 import re
+from functools import lru_cache
+
+_CAMEL_WORD_BOUNDARY = re.compile("(.)([A-Z][a-z]+)")
+_CAMEL_LOWER_UPPER_BOUNDARY = re.compile("([a-z0-9])([A-Z])")
 
 
 def is_dunder(name: str) -> bool:
@@ -25,9 +29,10 @@ def raise_on_invalid_collection_name(collection_name: str, cls_name: str) -> Non
         )
 
 
+@lru_cache(maxsize=None)
 def to_snake_case(s: str) -> str:
-    tmp = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", s)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", tmp).lower()
+    tmp = _CAMEL_WORD_BOUNDARY.sub(r"\1_\2", s)
+    return _CAMEL_LOWER_UPPER_BOUNDARY.sub(r"\1_\2", tmp).lower()
 
 
 class Undefined:
@@ -2,7 +2,7 @@ from decimal import Decimal
 
 import bson
 
-from odmantic import Model
+from odmantic import Field, Model
 
 
 def test_objectid_serialization():
@@ -24,3 +24,14 @@ def test_extra_allowed_bson_serialization():
     instance = M(extra_field=Decimal("1.1"))
     doc = instance.model_dump_doc()
     assert isinstance(doc["extra_field"], bson.Decimal128)
+
+
+def test_plain_fields_serialization_order_and_key_names():
+    class M(Model):
+        b: int = Field(key_name="_b")
+        a: str
+
+    instance = M(a="a", b=1)
+    doc = instance.model_dump_doc()
+    assert list(doc.keys()) == ["_b", "a", "_id"]
+    assert doc == {"_b": 1, "a": "a", "_id": instance.id}
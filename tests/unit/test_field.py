@@ -1,3 +1,5 @@
+import enum
+
 import pytest
 
 from odmantic.field import Field
@@ -25,6 +27,16 @@ def test_field_define_key_as__id_without_setting_as_primary():
         Field(key_name="_id")
 
 
+def test_str_enum_key_name():
+    class KeyNames(str, enum.Enum):
+        ALTERNATE = "alternate_name"
+
+    class M(Model):
+        field: int = Field(key_name=KeyNames.ALTERNATE)
+
+    assert M(field=1).model_dump_doc()["alternate_name"] == 1
+
+
 def test_pos_key_name():
     class M(Model):
         field: int = Field(key_name="alternate_name")
@@ -22,7 +22,7 @@ from bson import ObjectId
 from bson.decimal128 import Decimal128
 from bson.regex import Regex
 from pydantic import Field as PDField
-from pydantic import ValidationError
+from pydantic import ValidationError, computed_field
 
 from odmantic import ObjectId as ODMObjectId
 from odmantic.field import Field
@@ -419,6 +419,32 @@ def test_model_definition_extra_allow():
     assert instance.model_dump_doc(include={"f", "g"}) == {"f": 1, "g": 2}
 
 
+def test_model_definition_extra_allow_always_included():
+    class M(Model):
+        model_config = {"extra": "allow"}
+
+        f: int
+        h: int
+
+    instance = M(f=1, g=2, h=3)
+    assert instance.model_dump_doc(include={"f"}) == {"f": 1, "g": 2}
+
+
+def test_model_definition_extra_allow_computed_field_always_included():
+    class M(Model):
+        model_config = {"extra": "allow"}
+
+        f: int
+
+        @computed_field  # type: ignore[misc]
+        @property
+        def double(self) -> int:
+            return self.f * 2
+
+    instance = M(f=1)
+    assert instance.model_dump_doc(include={"f"}) == {"f": 1, "double": 2}
+
+
 def test_model_definition_extra_ignore():
     class M(Model):
         model_config = {"extra": "ignore"}
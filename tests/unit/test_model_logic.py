@@ -106,6 +106,27 @@ def test_fields_modified_on_document_parsing():
     assert instance.__fields_modified__ == set(["first_name", "last_name", "id"])
 
 
+def test_document_parsing_keyname():
+    class M(Model):
+        field: str = Field(key_name="custom")
+        other: int = 0
+
+    id = ObjectId()
+    instance = M.model_validate_doc({"_id": id, "custom": "value", "other": 1})
+    assert instance.id == id
+    assert instance.field == "value"
+    assert instance.other == 1
+
+
+def test_document_parsing_missing_key_with_default():
+    class M(Model):
+        field: str = Field(key_name="custom")
+        other: int = 0
+
+    instance = M.model_validate_doc({"_id": ObjectId(), "custom": "value"})
+    assert instance.other == 0
+
+
 def test_document_parsing_error_keyname():
     class M(Model):
         field: str = Field(key_name="custom")